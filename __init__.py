@@ -53,23 +53,29 @@ IO_PDX_SETTINGS = PDXsettings(config_path)
 
 # setup engine/export settings
 export_settings = path.join(root_path, "clausewitz.json")
-ENGINE_SETTINGS = {}
-try:
-    if ".zip" in export_settings:
-        zipped = export_settings.split(".zip")[0] + ".zip"
-        with zipfile.ZipFile(zipped, "r") as z:
-            f = z.open("io_pdx_mesh/clausewitz.json")
-            ENGINE_SETTINGS = json.loads(f.read(), object_pairs_hook=OrderedDict)
-    else:
-        with open(export_settings, "rt") as f:
-            ENGINE_SETTINGS = json.load(f, object_pairs_hook=OrderedDict)
-except Exception as err:
-    print(err)
-    msg = (
-        "CRITICAL ERROR! Your 'clausewitz.json' settings file has errors and is unreadable."
-        "Some functions of the tool will not work without these settings."
-    )
-    raise RuntimeError(msg)  # noqa: B904
+
+
+def load_engine_settings(filepath=export_settings):
+    """Reads the engine/export settings file, this may be contained inside a zipped addon."""
+    try:
+        if ".zip" in filepath:
+            zipped = filepath.split(".zip")[0] + ".zip"
+            with zipfile.ZipFile(zipped, "r") as z:
+                f = z.open("io_pdx_mesh/clausewitz.json")
+                return json.loads(f.read(), object_pairs_hook=OrderedDict)
+        else:
+            with open(filepath, "rt") as f:
+                return json.load(f, object_pairs_hook=OrderedDict)
+    except Exception:
+        logging.getLogger(log_name).exception("Failed to load engine settings from %s", filepath)
+        msg = (
+            "CRITICAL ERROR! Your 'clausewitz.json' settings file has errors and is unreadable."
+            "Some functions of the tool will not work without these settings."
+        )
+        raise RuntimeError(msg)  # noqa: B904
+
+
+ENGINE_SETTINGS = load_engine_settings()
 
 
 """ ====================================================================================================================
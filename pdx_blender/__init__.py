@@ -18,7 +18,7 @@ from bpy.props import (  # type: ignore
 )
 from bpy.types import PropertyGroup  # type: ignore
 
-from .. import ENGINE_SETTINGS, IO_PDX_LOG, IO_PDX_SETTINGS
+from .. import ENGINE_SETTINGS, IO_PDX_LOG, IO_PDX_SETTINGS, load_engine_settings
 from . import blender_import_export, blender_ui
 
 importlib.reload(blender_import_export)
@@ -31,12 +31,15 @@ importlib.reload(blender_ui)
 """
 
 
-# fmt:off
-class PDXBlender_settings(PropertyGroup):
-    engine_items = [(engine, ) * 3 for engine in ENGINE_SETTINGS]
-    engine_default = IO_PDX_SETTINGS.last_set_engine or list(ENGINE_SETTINGS)[0]
+def get_engine_property():
+    """Builds the engine EnumProperty from a static item list, rather than an items callback evaluated on every
+    redraw. The items only change when engine settings are reloaded, see `reload_engine_settings`."""
+    engine_items = tuple((engine,) * 3 for engine in ENGINE_SETTINGS)
+    engine_default = IO_PDX_SETTINGS.last_set_engine
+    if engine_default not in ENGINE_SETTINGS:
+        engine_default = engine_items[0][0]
 
-    setup_engine: EnumProperty(
+    return EnumProperty(
         name="Engine",
         description="Engine",
         items=engine_items,
@@ -45,6 +48,11 @@ class PDXBlender_settings(PropertyGroup):
     )
 
 
+# fmt:off
+class PDXBlender_settings(PropertyGroup):
+    setup_engine: get_engine_property()
+
+
 class PDXMaterial_settings(PropertyGroup):
     mat_name: StringProperty(
         name="Material name",
@@ -106,6 +114,7 @@ classes.sort(key=lambda cls: cls.panel_order if hasattr(cls, "panel_order") else
 
 def register():
     IO_PDX_LOG.info("Loading Blender UI.")
+    blender_ui.build_material_items()
     for cls in classes:
         bpy.utils.register_class(cls)
 
@@ -116,6 +125,32 @@ def register():
     bpy.types.Scene.io_pdx_export = PointerProperty(type=PDXExport_settings)
 
 
+def reload_engine_settings():
+    """Re-reads the engine settings file and re-registers the settings class so the engine list is up to date."""
+    # load before touching the shared settings, so a broken file leaves the current settings in place
+    new_settings = load_engine_settings()
+    ENGINE_SETTINGS.clear()
+    ENGINE_SETTINGS.update(new_settings)
+    blender_ui.build_material_items()
+
+    # the engine enum is stored by index, record each scenes engine by name so it survives the item list changing
+    scene_engines = {scene: scene.io_pdx_settings.setup_engine for scene in bpy.data.scenes}
+
+    del bpy.types.Scene.io_pdx_settings
+    bpy.utils.unregister_class(PDXBlender_settings)
+    PDXBlender_settings.__annotations__["setup_engine"] = get_engine_property()
+    bpy.utils.register_class(PDXBlender_settings)
+    bpy.types.Scene.io_pdx_settings = PointerProperty(type=PDXBlender_settings)
+
+    # restore each scenes engine, falling back to the first engine if it no longer exists
+    for scene, engine in scene_engines.items():
+        if engine not in ENGINE_SETTINGS:
+            engine = next(iter(ENGINE_SETTINGS))
+        scene.io_pdx_settings.setup_engine = engine
+
+    IO_PDX_LOG.info("Reloaded engine settings - {0}".format(", ".join(ENGINE_SETTINGS)))
+
+
 def unregister():
     for cls in classes:
         bpy.utils.unregister_class(cls)
@@ -340,10 +340,10 @@ def get_mesh_info(blender_obj, mat_id, split_criteria=None, split_all=False, sor
         # no mesh data collected?
         return {}, []
 
-    # calculate mesh bounds
-    x_vtx_pos = set(mesh_dict["p"][::3])
-    y_vtx_pos = set(mesh_dict["p"][1::3])
-    z_vtx_pos = set(mesh_dict["p"][2::3])
+    # calculate mesh bounds, from each axis of the flat position list
+    x_vtx_pos = mesh_dict["p"][::3]
+    y_vtx_pos = mesh_dict["p"][1::3]
+    z_vtx_pos = mesh_dict["p"][2::3]
     # min and max axis aligned bounding box
     mesh_dict["min"] = [min(x_vtx_pos), min(y_vtx_pos), min(z_vtx_pos)]
     mesh_dict["max"] = [max(x_vtx_pos), max(y_vtx_pos), max(z_vtx_pos)]
@@ -1196,6 +1196,8 @@ def import_meshfile(meshpath, imp_mesh=True, imp_skel=True, imp_locs=True, join_
 
     # read the file into an XML structure
     asset_elem = pdx_data.read_meshfile(meshpath)
+    # textures are looked up relative to the mesh file
+    mesh_dir = os.path.split(meshpath)[0]
 
     # find shapes and locators
     shapes = asset_elem.find("object")
@@ -1246,7 +1248,7 @@ def import_meshfile(meshpath, imp_mesh=True, imp_skel=True, imp_locs=True, join_
                 # create the material
                 if pdx_material:
                     IO_PDX_LOG.info("creating material - {0}".format(pdx_material.shader[0]))
-                    create_material(pdx_material, mesh, os.path.split(meshpath)[0])
+                    create_material(pdx_material, mesh, mesh_dir)
 
                 # create the vertex group skin
                 if rig and pdx_skin:
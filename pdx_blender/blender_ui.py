@@ -43,20 +43,44 @@ except Exception as err:
 ========================================================================================================================
 """
 
+# update check runs once on import, so build the update button text and url once rather than on every panel draw
+UPDATE_BTN_TXT, UPDATE_BTN_URL = None, None
+if github.AT_LATEST is False:
+    UPDATE_BTN_TXT = "UPDATE - v{}".format(github.LATEST_VERSION)
+    UPDATE_BTN_URL = str((github.LATEST_URL or {}).get("blender", github.LATEST_RELEASE))
+
+
+# EnumProperty items should be a static sequence unless they truly depend on scene state. Where a callback is needed,
+# it must return cached items, Blender does not hold references to the strings returned by an items callback
+ENGINE_MATERIAL_ITEMS = {}
+
+
+def build_material_items():
+    """Builds the static material enum items for each engine, called on register and when engine settings reload."""
+    ENGINE_MATERIAL_ITEMS.clear()
+    for engine, engine_settings in ENGINE_SETTINGS.items():
+        material_items = [("__NONE__", "", "")]
+        material_items.extend((material, material, material) for material in engine_settings["material"])
+        ENGINE_MATERIAL_ITEMS[engine] = tuple(material_items)
+
 
 def get_material_list(self, context):
+    # dynamic only in which engine is selected, the items per engine are prebuilt
     sel_engine = context.scene.io_pdx_settings.setup_engine
 
-    material_list = [(material, material, material) for material in ENGINE_SETTINGS[sel_engine]["material"]]
-    material_list.insert(0, ("__NONE__", "", ""))
+    return ENGINE_MATERIAL_ITEMS.get(sel_engine, ())
 
-    return material_list
+
+# scene materials truly depend on scene state, so these items are rebuilt on each call but held here between calls
+SCENE_MATERIAL_ITEMS = []
 
 
 def get_scene_material_list(self, context):
-    material_list = [(mat.name, mat.name, mat.name) for mat in bpy.data.materials if mat.get(PDX_SHADER, None)]
+    SCENE_MATERIAL_ITEMS[:] = [
+        (mat.name, mat.name, mat.name) for mat in bpy.data.materials if mat.get(PDX_SHADER, None)
+    ]
 
-    return material_list
+    return SCENE_MATERIAL_ITEMS
 
 
 def set_engine(self, context):
@@ -194,8 +218,8 @@ class IOPDX_OT_material_edit_popup(material_popup, Operator):
     bl_idname = "io_pdx_mesh.material_edit_popup"
     bl_description = bl_label = "Edit a PDX material"
 
-    def mat_select(self, context):
-        mat = bpy.data.materials[self.scene_mats]
+    def mat_select(self, context, mat=None):
+        mat = mat or bpy.data.materials[self.scene_mats]
         curr_mat = context.scene.io_pdx_material
         curr_mat.mat_name = mat.name
         curr_mat.mat_type = mat[PDX_SHADER]
@@ -222,9 +246,9 @@ class IOPDX_OT_material_edit_popup(material_popup, Operator):
     def invoke(self, context, event):
         pdx_scene_materials = get_scene_material_list(self, context)
         if pdx_scene_materials:
-            if self.scene_mats in bpy.data.materials:
-                self.mat_select(context)
-                mat = bpy.data.materials[self.scene_mats]
+            mat = bpy.data.materials.get(self.scene_mats)
+            if mat is not None:
+                self.mat_select(context, mat=mat)
                 self.mat_name = mat.name
                 self.custom_type = mat[PDX_SHADER]
                 return context.window_manager.invoke_props_dialog(self, width=350)
@@ -265,19 +289,19 @@ class IOPDX_OT_mesh_index_actions(Operator):
     def poll(cls, context):
         return context.scene.io_pdx_group
 
-    def move_index(self):
-        list_index = bpy.context.scene.io_pdx_group.idx
-        list_length = len(bpy.context.scene.io_pdx_group.coll) - 1
+    def move_index(self, obj_group):
+        list_index = obj_group.idx
+        list_length = len(obj_group.coll) - 1
 
         new_index = list_index + (-1 if self.action == "UP" else 1)
-        bpy.context.scene.io_pdx_group.idx = max(0, min(new_index, list_length))
+        obj_group.idx = max(0, min(new_index, list_length))
 
     def execute(self, context):
-        collection = context.scene.io_pdx_group.coll
-        index = context.scene.io_pdx_group.idx
+        obj_group = context.scene.io_pdx_group
+        index = obj_group.idx
         neighbor = index + (-1 if self.action == "UP" else 1)
-        collection.move(neighbor, index)
-        self.move_index()
+        obj_group.coll.move(neighbor, index)
+        self.move_index(obj_group)
 
         return {"FINISHED"}
 
@@ -299,10 +323,12 @@ class IOPDX_OT_mesh_index_popup(Operator):
         obj_group = context.scene.io_pdx_group
 
         obj_group.coll.clear()
-        pdx_scenemeshes = list_scene_pdx_meshes()
-        pdx_scenemeshes.sort(key=lambda obj: get_mesh_index(obj.data))
+        # pair each mesh with its index up front, sort on the index only as objects are not orderable
+        pdx_scenemeshes = sorted(
+            ((get_mesh_index(obj.data), obj) for obj in list_scene_pdx_meshes()), key=lambda pair: pair[0]
+        )
 
-        for obj in pdx_scenemeshes:
+        for _, obj in pdx_scenemeshes:
             item = obj_group.coll.add()
             item.name = obj.name
             item.ref = obj
@@ -319,7 +345,25 @@ class IOPDX_OT_mesh_index_popup(Operator):
         self.layout.separator()
 
 
-class IOPDX_OT_import_mesh(Operator, ImportHelper):
+class file_operator(object):
+    def run_file_io(self, io_func, action, asset_type, last_setting, **kwargs):
+        """Runs an import/export function on the operator filepath, reporting success or failure in the UI."""
+        try:
+            io_func(self.filepath, **kwargs)
+            self.report({"INFO"}, "[io_pdx_mesh] Finished {0}ing {1}".format(action, self.filepath))
+            setattr(IO_PDX_SETTINGS, last_setting, self.filepath)
+
+        except Exception as err:
+            IO_PDX_LOG.warning("FAILED to {0} {1}".format(action, self.filepath))
+            IO_PDX_LOG.error(err)
+            self.report({"WARNING"}, "{0} {1} failed!".format(asset_type, action))
+            self.report({"ERROR"}, str(err))
+            raise
+
+        return {"FINISHED"}
+
+
+class IOPDX_OT_import_mesh(file_operator, Operator, ImportHelper):
     bl_idname = "io_pdx_mesh.import_mesh"
     bl_description = bl_label = "Import PDX mesh"
     bl_options = {"REGISTER", "UNDO"}
@@ -378,26 +422,17 @@ class IOPDX_OT_import_mesh(Operator, ImportHelper):
         # box.prop(self, 'chk_bonespace')  # TODO: works but overcomplicates things, disabled for now
 
     def execute(self, context):
-        try:
-            import_meshfile(
-                self.filepath,
-                imp_mesh=self.chk_mesh,
-                imp_skel=self.chk_skel,
-                imp_locs=self.chk_locs,
-                join_materials=self.chk_joinmats,
-                bonespace=self.chk_bonespace,
-            )
-            self.report({"INFO"}, "[io_pdx_mesh] Finished importing {}".format(self.filepath))
-            IO_PDX_SETTINGS.last_import_mesh = self.filepath
-
-        except Exception as err:
-            IO_PDX_LOG.warning("FAILED to import {0}".format(self.filepath))
-            IO_PDX_LOG.error(err)
-            self.report({"WARNING"}, "Mesh import failed!")
-            self.report({"ERROR"}, str(err))
-            raise
-
-        return {"FINISHED"}
+        return self.run_file_io(
+            import_meshfile,
+            "import",
+            "Mesh",
+            "last_import_mesh",
+            imp_mesh=self.chk_mesh,
+            imp_skel=self.chk_skel,
+            imp_locs=self.chk_locs,
+            join_materials=self.chk_joinmats,
+            bonespace=self.chk_bonespace,
+        )
 
     def invoke(self, context, event):
         self.filepath = IO_PDX_SETTINGS.last_import_mesh or ""
@@ -406,7 +441,7 @@ class IOPDX_OT_import_mesh(Operator, ImportHelper):
         return {"RUNNING_MODAL"}
 
 
-class IOPDX_OT_import_anim(Operator, ImportHelper):
+class IOPDX_OT_import_anim(file_operator, Operator, ImportHelper):
     bl_idname = "io_pdx_mesh.import_anim"
     bl_description = bl_label = "Import PDX animation"
     bl_options = {"REGISTER", "UNDO"}
@@ -436,19 +471,7 @@ class IOPDX_OT_import_anim(Operator, ImportHelper):
         box.prop(self, "int_start")
 
     def execute(self, context):
-        try:
-            import_animfile(self.filepath, frame_start=self.int_start)
-            self.report({"INFO"}, "[io_pdx_mesh] Finsihed importing {}".format(self.filepath))
-            IO_PDX_SETTINGS.last_import_anim = self.filepath
-
-        except Exception as err:
-            IO_PDX_LOG.warning("FAILED to import {0}".format(self.filepath))
-            IO_PDX_LOG.error(err)
-            self.report({"WARNING"}, "Animation import failed!")
-            self.report({"ERROR"}, str(err))
-            raise
-
-        return {"FINISHED"}
+        return self.run_file_io(import_animfile, "import", "Animation", "last_import_anim", frame_start=self.int_start)
 
     def invoke(self, context, event):
         self.filepath = IO_PDX_SETTINGS.last_import_anim or ""
@@ -457,7 +480,7 @@ class IOPDX_OT_import_anim(Operator, ImportHelper):
         return {"RUNNING_MODAL"}
 
 
-class IOPDX_OT_export_mesh(Operator, ExportHelper):
+class IOPDX_OT_export_mesh(file_operator, Operator, ExportHelper):
     bl_idname = "io_pdx_mesh.export_mesh"
     bl_description = bl_label = "Export PDX mesh"
     bl_options = {"REGISTER", "UNDO"}
@@ -549,30 +572,21 @@ class IOPDX_OT_export_mesh(Operator, ExportHelper):
             col.prop(self, "chk_plain_txt")
 
     def execute(self, context):
-        try:
-            export_meshfile(
-                self.filepath,
-                exp_mesh=self.chk_mesh,
-                exp_skel=self.chk_skel,
-                exp_locs=self.chk_locs,
-                exp_selected=self.chk_selected,
-                as_blendshape=self.chk_mesh_blendshape,
-                debug_mode=self.chk_debug,
-                split_verts=self.chk_split_vtx,
-                sort_verts=self.ddl_sort_vtx,
-                plain_txt=self.chk_plain_txt,
-            )
-            self.report({"INFO"}, "[io_pdx_mesh] Finsihed exporting {}".format(self.filepath))
-            IO_PDX_SETTINGS.last_export_mesh = self.filepath
-
-        except Exception as err:
-            IO_PDX_LOG.warning("FAILED to export {0}".format(self.filepath))
-            IO_PDX_LOG.error(err)
-            self.report({"WARNING"}, "Mesh export failed!")
-            self.report({"ERROR"}, str(err))
-            raise
-
-        return {"FINISHED"}
+        return self.run_file_io(
+            export_meshfile,
+            "export",
+            "Mesh",
+            "last_export_mesh",
+            exp_mesh=self.chk_mesh,
+            exp_skel=self.chk_skel,
+            exp_locs=self.chk_locs,
+            exp_selected=self.chk_selected,
+            as_blendshape=self.chk_mesh_blendshape,
+            debug_mode=self.chk_debug,
+            split_verts=self.chk_split_vtx,
+            sort_verts=self.ddl_sort_vtx,
+            plain_txt=self.chk_plain_txt,
+        )
 
     def invoke(self, context, event):
         self.filepath = IO_PDX_SETTINGS.last_export_mesh or ""
@@ -581,7 +595,7 @@ class IOPDX_OT_export_mesh(Operator, ExportHelper):
         return {"RUNNING_MODAL"}
 
 
-class IOPDX_OT_export_anim(Operator, ExportHelper):
+class IOPDX_OT_export_anim(file_operator, Operator, ExportHelper):
     bl_idname = "io_pdx_mesh.export_anim"
     bl_description = bl_label = "Export PDX animation"
     bl_options = {"REGISTER", "UNDO"}
@@ -647,34 +661,25 @@ class IOPDX_OT_export_anim(Operator, ExportHelper):
             col.prop(self, "chk_plain_txt")
 
     def execute(self, context):
-        settings = context.scene.io_pdx_export
+        scene = context.scene
+        settings = scene.io_pdx_export
 
-        try:
-            if settings.custom_range:
-                start, end = self.int_start, self.int_end
-            else:
-                start, end = context.scene.frame_start, context.scene.frame_end
-
-            export_animfile(
-                self.filepath,
-                frame_start=start,
-                frame_end=end,
-                debug_mode=self.chk_debug,
-                uniform_scale=self.chk_uniform_scale,
-                plain_txt=self.chk_plain_txt,
-            )
-
-            self.report({"INFO"}, "[io_pdx_mesh] Finsihed exporting {}".format(self.filepath))
-            IO_PDX_SETTINGS.last_export_anim = self.filepath
-
-        except Exception as err:
-            IO_PDX_LOG.warning("FAILED to export {0}".format(self.filepath))
-            IO_PDX_LOG.error(err)
-            self.report({"WARNING"}, "Animation export failed!")
-            self.report({"ERROR"}, str(err))
-            raise
-
-        return {"FINISHED"}
+        if settings.custom_range:
+            start, end = self.int_start, self.int_end
+        else:
+            start, end = scene.frame_start, scene.frame_end
+
+        return self.run_file_io(
+            export_animfile,
+            "export",
+            "Animation",
+            "last_export_anim",
+            frame_start=start,
+            frame_end=end,
+            debug_mode=self.chk_debug,
+            uniform_scale=self.chk_uniform_scale,
+            plain_txt=self.chk_plain_txt,
+        )
 
     def invoke(self, context, event):
         self.filepath = IO_PDX_SETTINGS.last_export_anim or ""
@@ -722,6 +727,24 @@ class IOPDX_OT_ignore_bone(Operator):
         return {"FINISHED"}
 
 
+class IOPDX_OT_reload_settings(Operator):
+    bl_idname = "io_pdx_mesh.reload_settings"
+    bl_description = bl_label = "Reload engine settings"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        from . import reload_engine_settings
+
+        try:
+            reload_engine_settings()
+        except Exception:
+            # the failure is already logged with its traceback when loading the settings
+            self.report({"ERROR"}, "Failed to reload engine settings! Check the system console.")
+            return {"CANCELLED"}
+
+        return {"FINISHED"}
+
+
 """ ====================================================================================================================
     UI classes for the import/export tool.
 ========================================================================================================================
@@ -747,13 +770,10 @@ class IOPDX_PT_PDXblender_info(PDXUI, Panel):
         split = row.split(factor=0.85, align=True)
         col1, col3 = split.column(align=True), split.column(align=True)
         # update info appears if we aren't at the latest tag version
-        if github.AT_LATEST is False:
+        if UPDATE_BTN_TXT:
             split = col1.split(factor=0.4, align=True)
             col1, col2 = split.column(align=True), split.column(align=True)
-            btn_txt = "UPDATE - v{}".format(github.LATEST_VERSION)
-            col2.operator("wm.url_open", icon="OUTLINER_OB_LIGHT", text=btn_txt).url = str(
-                github.LATEST_URL.get("blender", github.LATEST_RELEASE)
-            )
+            col2.operator("wm.url_open", icon="OUTLINER_OB_LIGHT", text=UPDATE_BTN_TXT).url = UPDATE_BTN_URL
         col1.operator("wm.url_open", icon="FUND", text="Donate").url = str(IO_PDX_INFO["sponsor_url"])
         popup = col3.operator("io_pdx_mesh.popup_message", icon="INFO", text="")
         popup.msg_text = github.LATEST_NOTES
@@ -844,12 +864,15 @@ class IOPDX_PT_PDXblender_setup(PDXUI, Panel):
     panel_order = 4
 
     def draw(self, context):
-        settings = context.scene.io_pdx_settings
+        scene = context.scene
+        layout = self.layout
 
-        self.layout.prop(settings, "setup_engine")
-        row = self.layout.row(align=True)
+        row = layout.row(align=True)
+        row.prop(scene.io_pdx_settings, "setup_engine")
+        row.operator("io_pdx_mesh.reload_settings", icon="FILE_REFRESH", text="")
+        row = layout.row(align=True)
         row.label(text="Animation:")
-        row.prop(context.scene.render, "fps", text="FPS")
+        row.prop(scene.render, "fps", text="FPS")
 
 
 class IOPDX_PT_PDXblender_help(PDXUI, Panel):
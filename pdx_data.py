@@ -13,7 +13,13 @@ from __future__ import print_function, unicode_literals
 import json
 import logging
 import mmap
-from struct import pack, unpack_from
+import os
+import os.path as path
+import shutil
+import sys
+import tempfile
+from array import array
+from struct import Struct, pack
 
 try:
     import xml.etree.cElementTree as Xml
@@ -22,7 +28,31 @@ except ImportError:
 
 from .external import six
 
+# library style logging, callers are responsible for configuring handlers (as the addon and command line entry do)
+# the null handler avoids Py2 reporting "No handlers could be found" in place of messages when nothing is configured
 DATA_LOG = logging.getLogger("io_pdx.data")
+DATA_LOG.addHandler(logging.NullHandler())
+
+# the binary format is little-endian, all struct formats state this explicitly (which also disables alignment padding)
+# precompiled formats for single value reads/writes, avoids struct parsing the format string on every call
+BYTE = Struct("<b")
+INT = Struct("<i")
+UBYTE = Struct("<B")
+# data type character followed by the data count
+DATA_HEADER = Struct("<ci")
+# string data type character, data count and string length
+STRING_HEADER = Struct("<cii")
+
+# binary file header
+BINARY_HEADER = b"@@b@"
+
+# bytes marking the start of an object or property in binary data, and their values for comparing when reading
+OBJECT_MARKER = b"["
+PROPERTY_MARKER = b"!"
+OBJECT_BYTE = ord(OBJECT_MARKER)
+PROPERTY_BYTE = ord(PROPERTY_MARKER)
+# zero byte ending for strings and object names
+ZERO_BYTE = b"\x00"
 
 
 """ ====================================================================================================================
@@ -45,44 +75,50 @@ class PDXData(object):
         # object attribute collection
         self.attrlist = []
 
+        # work on the instance dict directly, rather than through setattr/hasattr/getattr for every attribute
+        data = self.__dict__
+        cls = type(self)
+
         # set XML element attributes as object attributes
-        for attr in element.attrib:
-            setattr(self, attr, element.attrib[attr])
-            self.attrlist.append(attr)
+        data.update(element.attrib)
+        self.attrlist.extend(element.attrib)
 
         # iterate over XML element children, set these as attributes, nesting further PDXData objects
-        for child in list(element):
-            child_data = type(self)(child, self.depth + 1)
-            if hasattr(self, child.tag):
-                curr_data = getattr(self, child.tag)
+        for child in element:
+            tag = child.tag
+            child_data = cls(child, self.depth + 1)
+            if tag in data:
+                curr_data = data[tag]
                 if isinstance(curr_data, list):
                     curr_data.append(child_data)
                 else:
-                    setattr(self, child.tag, [curr_data, child_data])
+                    data[tag] = [curr_data, child_data]
             else:
-                setattr(self, child.tag, child_data)
-                self.attrlist.append(child.tag)
+                data[tag] = child_data
+                self.attrlist.append(tag)
 
     def __str__(self):
-        indent = " " * 4
+        indent = " " * 4 * self.depth
         string = []
+        cls = type(self)
 
         for _key in self.attrlist:
             _val = getattr(self, _key)
 
-            if isinstance(_val, type(self)):
-                string.append("{}{}:".format(self.depth * indent, _key))
+            if isinstance(_val, cls):
+                string.append("{}{}:".format(indent, _key))
                 string.append("{}".format(_val))
 
             else:
-                if all(isinstance(v, type(self)) for v in _val):
+                if all(isinstance(v, cls) for v in _val):
                     for v in _val:
-                        string.append("{}{}:".format(self.depth * indent, _key))
+                        string.append("{}{}:".format(indent, _key))
                         string.append("{}".format(v))
                 else:
+                    # data arrays are homogeneous, so the first value gives the type
                     data_len = len(_val)
-                    data_type = list(set(type(v) for v in _val))[0].__name__
-                    string.append("{}{} ({}, {}):  {}".format(self.depth * indent, _key, data_type, data_len, _val))
+                    data_type = type(_val[0]).__name__
+                    string.append("{}{} ({}, {}):  {}".format(indent, _key, data_type, data_len, _val))
 
         return "\n".join(string)
 
@@ -90,14 +126,9 @@ class PDXData(object):
 class PDXDataJSON(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, PDXData):
-            d = {}
-            for attr in obj.attrlist:
-                val = getattr(obj, attr)
-                if isinstance(val, list):
-                    d[attr] = [v for v in val]
-                else:
-                    d[attr] = val
-            return d
+            # lists are serialised as they are, no need to copy them
+            data = obj.__dict__
+            return {attr: data[attr] for attr in obj.attrlist}
         return super(PDXDataJSON, self).default(obj)
 
 
@@ -109,20 +140,21 @@ class PDXDataJSON(json.JSONEncoder):
 
 def parseObject(bdata, pos):
     # record any repeated `[` characters as object depth
-    objdepth = 0
-    while unpack_from("c", bdata, offset=pos)[0].decode() == "[":
-        objdepth += 1
+    # compare single byte slices, indexing mmap or bytes gives an int in Py3 but a str in Py2
+    start = pos
+    while bdata[pos : pos + 1] == OBJECT_MARKER:
         pos += 1
+    objdepth = pos - start
 
     # get object name as string
-    obj_name = ""
     # we don't know the string length, so look for an ending byte of zero
-    while unpack_from("b", bdata, offset=pos)[0] != 0:
-        obj_name += unpack_from("c", bdata, offset=pos)[0].decode("latin-1")
-        pos += 1
+    name_end = bdata.find(ZERO_BYTE, pos)
+    if name_end == -1:
+        raise NotImplementedError("Unterminated object name encountered at position {}".format(pos))
+    obj_name = bdata[pos:name_end].decode("latin-1")
 
     # skip the ending zero byte
-    pos += 1
+    pos = name_end + 1
 
     return obj_name, objdepth, pos
 
@@ -132,7 +164,7 @@ def parseProperty(bdata, pos):
     pos += 1
 
     # get length of property name
-    prop_name_length = unpack_from("b", bdata, offset=pos)[0]
+    prop_name_length = BYTE.unpack_from(bdata, offset=pos)[0]
     pos += 1
 
     # get property name as string
@@ -146,70 +178,74 @@ def parseProperty(bdata, pos):
 
 
 def parseString(bdata, pos, length):
-    val_tuple = unpack_from("c" * length, bdata, offset=pos)  # TODO: should fmt here be "s" * length ?
-
-    # turn the resulting tuple into a string of bytes
-    string = b"".join(val_tuple).decode("latin-1")
+    # slice out the string bytes directly, rather than unpacking to a tuple of single characters
+    string = bdata[pos : pos + length]
 
-    # check if the ending byte is zero and remove if so
-    if string[-1] == chr(0):
+    # check if the ending byte is zero and remove if so, before decoding
+    if string.endswith(ZERO_BYTE):
         string = string[:-1]
 
-    return string
+    return string.decode("latin-1")
 
 
-def parseData(bdata, pos):
-    # determine the data type
-    datatype = unpack_from("c", bdata, offset=pos)[0].decode()
-    pos += 1
-    # determine the data count
-    datacount = unpack_from("i", bdata, offset=pos)[0]
-    pos += 4
-    # collect data values
-    # TODO: use an array here instead of list for memory efficiency?
-    datavalues = []
-
-    # handle integer data
-    if datatype == "i":
-        val = unpack_from("i" * datacount, bdata, offset=pos)
-        datavalues.extend(val)
-        pos += 4 * datacount
-
-    # handle float data
-    elif datatype == "f":
-        val = unpack_from("f" * datacount, bdata, offset=pos)
-        datavalues.extend(val)
-        pos += 4 * datacount
-
-    # handle string data
-    elif datatype == "s":
-        # TODO: we are assuming that we always have a data count of 1 string, not an array of multiple strings
-        # string length
-        str_data_length = unpack_from("i", bdata, offset=pos)[0]
-        pos += 4
-
-        val = parseString(bdata, pos, str_data_length)
-        datavalues.append(val)
-        pos += str_data_length
+def parseArray(bdata, pos, typecode, count):
+    # check the whole block is present, a truncated or corrupt file would otherwise decode as a shorter array
+    if count < 0 or pos + 4 * count > len(bdata):
+        raise NotImplementedError("Truncated data block encountered. {} values at position {}".format(count, pos))
 
+    # decode the whole block of values into a typed array in one go, then convert to a list
+    values = array(str(typecode))  # Py2 array typecode cannot be unicode
+    if six.PY2:
+        values.fromstring(bdata[pos : pos + 4 * count])
     else:
+        # a memoryview slice avoids copying the block out of the file data first, release it so the mmap can close
+        with memoryview(bdata) as view:
+            values.frombytes(view[pos : pos + 4 * count])
+    # file data is little-endian, swap the whole block at once on a big-endian host
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values.tolist()
+
+
+def parseIntData(bdata, pos, count):
+    return parseArray(bdata, pos, "i", count), pos + 4 * count
+
+
+def parseFloatData(bdata, pos, count):
+    return parseArray(bdata, pos, "f", count), pos + 4 * count
+
+
+def parseStringData(bdata, pos, count):
+    # TODO: we are assuming that we always have a data count of 1 string, not an array of multiple strings
+    # string length
+    str_data_length = INT.unpack_from(bdata, offset=pos)[0]
+    pos += 4
+
+    return [parseString(bdata, pos, str_data_length)], pos + str_data_length
+
+
+# data parsing functions by the raw data type character
+DATA_PARSERS = {b"i": parseIntData, b"f": parseFloatData, b"s": parseStringData}
+
+
+def parseData(bdata, pos):
+    # determine the data type and data count
+    datatype, datacount = DATA_HEADER.unpack_from(bdata, offset=pos)
+    pos += DATA_HEADER.size
+
+    # look up the parser for this data type, int and float data is decoded in bulk, all data is returned as a list
+    data_parser = DATA_PARSERS.get(datatype)
+    if data_parser is None:
         raise NotImplementedError(
             "Unknown data type encountered. {} at position {}\neg: {}".format(datatype, pos, bdata[pos - 10 : pos + 10])
         )
 
-    return datavalues, pos
+    return data_parser(bdata, pos, datacount)
 
 
-def read_meshfile(filepath):
-    """Reads through a .mesh file and gathers all the data into hierarchical element structure.
-    The resulting XML is not natively writable to string as it contains Python data types."""
-    # read the data
-    with open(filepath, "rb") as fp:
-        # TODO: adopt the Py3 only use of context manager for mmap
-        mm_fp = mmap.mmap(fp.fileno(), length=0, access=mmap.ACCESS_READ)
-        fdata = mm_fp.read(mm_fp.size())
-        mm_fp.close()
-
+def parseFile(fdata):
+    """Parses binary file data into a hierarchical element structure, see `read_meshfile`."""
     # create an XML structure to store the object hierarchy
     file_element = Xml.Element("File")
 
@@ -217,12 +253,11 @@ def read_meshfile(filepath):
     eof = len(fdata)
     pos = 0
 
-    # read the file header '@@b@'
-    header = unpack_from("4c", fdata, pos)
-    if bytes(b"".join(header)) == b"@@b@":
-        pos += 4
+    # read the file header '@@b@', matched in place as mmap has no startswith
+    if fdata.find(BINARY_HEADER, pos, pos + len(BINARY_HEADER)) == pos:
+        pos += len(BINARY_HEADER)
     else:
-        raise NotImplementedError("Unknown file header. {}".format(header))
+        raise NotImplementedError("Unknown file header. {}".format(fdata[pos : pos + len(BINARY_HEADER)]))
 
     parent_element = file_element
     depth_list = [file_element]
@@ -230,17 +265,18 @@ def read_meshfile(filepath):
 
     # parse through until EOF
     while pos < eof:
-        next_char = unpack_from("c", fdata, offset=pos)[0].decode()
+        # dispatch on the raw byte value, an int under both Py2 and Py3
+        next_byte = UBYTE.unpack_from(fdata, offset=pos)[0]
         # we have an object
-        if next_char == "[":
+        if next_byte == OBJECT_BYTE:
             # check the object type and hierarchy depth
             obj_name, depth, pos = parseObject(fdata, pos)
 
             # deeper branch of the tree => current parent valid
             # same or shallower branch of the tree => parent gets redefined back a level
             if not depth > current_depth:
-                # remove elements from depth list, change parent
-                depth_list = depth_list[:depth]
+                # remove elements from depth list in place, change parent
+                del depth_list[depth:]
                 parent_element = depth_list[-1]
 
             # create a new object as a child of the current parent
@@ -252,12 +288,12 @@ def read_meshfile(filepath):
             current_depth = depth
 
         # we have a property (of the last read object)
-        elif next_char == "!":
+        elif next_byte == PROPERTY_BYTE:
             # check the property type and values
             prop_name, prop_values, pos = parseProperty(fdata, pos)
 
-            # assign property values to the parent object
-            parent_element.set(prop_name, prop_values)
+            # assign property values to the parent object, directly into its attribute dict
+            parent_element.attrib[prop_name] = prop_values
 
         # we have something that we can't parse
         else:
@@ -266,6 +302,22 @@ def read_meshfile(filepath):
     return file_element
 
 
+def read_meshfile(filepath):
+    """Reads through a .mesh file and gathers all the data into hierarchical element structure.
+    The resulting XML is not natively writable to string as it contains Python data types."""
+    # memory map the file and parse directly from the mapped data, rather than reading a full copy of it
+    with open(filepath, "rb") as fp:
+        # TODO: adopt the Py3 only use of context manager for mmap
+        fdata = mmap.mmap(fp.fileno(), length=0, access=mmap.ACCESS_READ)
+        try:
+            # data is parsed front to back, so hint the OS to read ahead where supported (Py3.8+, Unix only)
+            if hasattr(fdata, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                fdata.madvise(mmap.MADV_SEQUENTIAL)
+            return parseFile(fdata)
+        finally:
+            fdata.close()
+
+
 """ ====================================================================================================================
     Functions for writing XML tree to binary data.
 ========================================================================================================================
@@ -274,110 +326,113 @@ def read_meshfile(filepath):
 
 def writeObject(obj_xml, obj_depth):
     DATA_LOG.debug("writeObject: %s", obj_depth * "-")
-    datastring = b""
-
-    # write object hierarchy depth
-    for _ in range(obj_depth):
-        datastring += pack("c", "[".encode())
+    datastring = bytearray()
 
     # write object name as string
     obj_name = obj_xml.tag
     if not len(obj_name) < 64:
         raise NotImplementedError("Object name is longer than 64 characters: {}".format(obj_name))
+
+    # write object hierarchy depth, object name and zero-byte ending
+    datastring += OBJECT_MARKER * obj_depth
     datastring += writeString(obj_name)
-    # write zero-byte ending
-    datastring += pack("x")
+    datastring += ZERO_BYTE
 
     return datastring
 
 
-def writeProperty(prop_name, prop_data):
+def writeProperty(prop_name, prop_data, datastring=None):
     DATA_LOG.debug("writeProperty:")
-    datastring = b""
+    # optionally append to an existing buffer, as with writeData
+    if datastring is None:
+        datastring = bytearray()
 
     try:
         # write starting '!'
-        datastring += pack("c", "!".encode())
+        datastring += PROPERTY_MARKER
 
         # write length of property name
         prop_name_length = len(prop_name)
-        datastring += pack("b", prop_name_length)
+        datastring += BYTE.pack(prop_name_length)
 
         # write property name as string
         datastring += writeString(prop_name)
 
         # write property data
-        datastring += writeData(prop_data)
+        writeData(prop_data, datastring)
 
     except NotImplementedError as err:
-        print("Failed writing property: {}".format(prop_name))
+        DATA_LOG.error("Failed writing property: %s", prop_name)
         raise err
 
     return datastring
 
 
+def iterProperties(element, properties):
+    """Yields the given properties of an element, in the order given, skipping any the element does not have.
+    Each property is yielded as its own chunk, so large data blocks are never joined together in memory."""
+    for prop in properties:
+        prop_data = element.get(prop)
+        if prop_data is not None:
+            yield writeProperty(prop, prop_data)
+
+
 def writeString(string):
     DATA_LOG.debug("writeString: '%s'", string)
-    datastring = b""
 
-    string = string.encode("latin-1")
-    datastring += pack("{0}s".format(len(string)), string)
+    # the encoded bytes are already the binary data, no need to pack them
+    return string.encode("latin-1")
 
-    return datastring
 
+def packArray(typecode, data_array):
+    return pack("<{0}{1}".format(len(data_array), typecode), *data_array)
 
-def writeData(data_array):
-    DATA_LOG.debug("writeData: [%s]", ", ".join([str(d) for d in data_array]))
-    datastring = b""
 
-    # determine the data type in the array
-    types = set([type(d) for d in data_array])
-    if len(types) == 1:
-        datatype = types.pop()
-    elif len(types) < 1:
+def writeData(data_array, datastring=None):
+    # only build the debug string of every value when it will actually be logged
+    if DATA_LOG.isEnabledFor(logging.DEBUG):
+        DATA_LOG.debug("writeData: [%s]", ", ".join([str(d) for d in data_array]))
+    # optionally append to an existing buffer, so large data blocks are not copied again by the caller
+    if datastring is None:
+        datastring = bytearray()
+
+    if not data_array:
         return datastring
-    else:
-        raise NotImplementedError("Mixed data types encountered. - {}".format(types))
 
-    if all(isinstance(d, int) for d in data_array):
-        # write integer data
-        datastring += pack("c", "i".encode())
+    # determine the data type in the array, checking in a single pass that every value shares the same type
+    datatype = type(data_array[0])
+    if not all(type(d) is datatype for d in data_array):
+        types = set(type(d) for d in data_array)
+        raise NotImplementedError("Mixed data types encountered. - {}".format(types))
 
-        # write the data count
+    if issubclass(datatype, int):
+        # write integer data type and the data count
         size = len(data_array)
-        datastring += pack("i", size)
+        datastring += DATA_HEADER.pack(b"i", size)
 
-        # write the data values
-        datastring += pack("i" * size, *data_array)
+        # write the data values, with a counted format rather than a format string as long as the data
+        datastring += packArray("i", data_array)
 
-    elif all(isinstance(d, float) for d in data_array):
-        # write float data
-        datastring += pack("c", "f".encode())
-
-        # count
+    elif issubclass(datatype, float):
+        # write float data type and count
         size = len(data_array)
-        datastring += pack("i", size)
+        datastring += DATA_HEADER.pack(b"f", size)
 
         # values
-        datastring += pack("f" * size, *data_array)
-
-    elif all(isinstance(d, six.string_types) for d in data_array):
-        # write string data
-        datastring += pack("c", "s".encode())
+        datastring += packArray("f", data_array)
 
-        # count
+    elif issubclass(datatype, six.string_types):
+        # write string data type, count and string length
         size = 1
         # TODO: we are assuming that we always have a count of 1 string, not an array of multiple strings
-        datastring += pack("i", size)
-
-        # string length
         str_data_length = len(data_array[0])
-        datastring += pack("i", (str_data_length + 1))  # string length + 1 to account for zero-byte ending
+        # string length + 1 to account for zero-byte ending
+        datastring += STRING_HEADER.pack(b"s", size, str_data_length + 1)
 
         # values
         datastring += writeString(data_array[0])  # Py2 struct.pack cannot handle unicode strings
         # write zero-byte ending
-        datastring += pack("x")
+        datastring += ZERO_BYTE
 
     else:
         raise NotImplementedError("Unknown data type encountered. {}\neg: {}".format(datatype, data_array[0]))
@@ -385,18 +440,14 @@ def writeData(data_array):
     return datastring
 
 
-def write_meshfile(filepath, root_xml):
-    """Iterates over an XML element and writes the element structure back into a binary file as mesh data."""
-    datastring = b""
-
+def iterMeshData(root_xml):
+    """Iterates over an XML element and yields the element structure as chunks of binary mesh data."""
     # write the file header '@@b@'
-    header = "@@b@"
-    for x in header:
-        datastring += pack("c", x.encode())
+    yield BINARY_HEADER
 
     # write the file properties
     if root_xml.tag == "File":
-        datastring += writeProperty("pdxasset", root_xml.get("pdxasset"))
+        yield writeProperty("pdxasset", root_xml.get("pdxasset"))
     else:
         raise NotImplementedError("Unknown XML root encountered. {}".format(root_xml.tag))
 
@@ -406,97 +457,83 @@ def write_meshfile(filepath, root_xml):
     object_xml = root_xml.find("object")
     if object_xml is not None:
         current_depth = 1
-        datastring += writeObject(object_xml, current_depth)
+        yield writeObject(object_xml, current_depth)
 
         # write each shape node
         for shape_xml in object_xml:
             current_depth = 2
-            datastring += writeObject(shape_xml, current_depth)
+            yield writeObject(shape_xml, current_depth)
 
             # write shape properties
-            for prop in ["lod"]:
-                if shape_xml.get(prop) is not None:
-                    datastring += writeProperty(prop, shape_xml.get(prop))
+            for chunk in iterProperties(shape_xml, ["lod"]):
+                yield chunk
 
             # write each mesh
             for child_xml in shape_xml:
                 current_depth = 3
-                datastring += writeObject(child_xml, current_depth)
+                yield writeObject(child_xml, current_depth)
 
                 if child_xml.tag == "mesh":
                     mesh_xml = child_xml
                     # write mesh properties
-                    for prop in ["p", "n", "ta", "u0", "u1", "u2", "u3", "tri", "boundingsphere"]:
-                        if mesh_xml.get(prop) is not None:
-                            datastring += writeProperty(prop, mesh_xml.get(prop))
+                    mesh_props = ["p", "n", "ta", "u0", "u1", "u2", "u3", "tri", "boundingsphere"]
+                    for chunk in iterProperties(mesh_xml, mesh_props):
+                        yield chunk
 
                     # write mesh sub-objects
                     aabb_xml = mesh_xml.find("aabb")
                     if aabb_xml is not None:
                         current_depth = 4
-                        datastring += writeObject(aabb_xml, current_depth)
-                        for prop in ["min", "max"]:
-                            if aabb_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, aabb_xml.get(prop))
+                        yield writeObject(aabb_xml, current_depth)
+                        for chunk in iterProperties(aabb_xml, ["min", "max"]):
+                            yield chunk
 
                     material_xml = mesh_xml.find("material")
                     if material_xml is not None:
                         current_depth = 4
-                        datastring += writeObject(material_xml, current_depth)
-                        for prop in ["shader", "diff", "n", "spec"]:
-                            if material_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, material_xml.get(prop))
+                        yield writeObject(material_xml, current_depth)
+                        for chunk in iterProperties(material_xml, ["shader", "diff", "n", "spec"]):
+                            yield chunk
 
                     skin_xml = mesh_xml.find("skin")
                     if skin_xml is not None:
                         current_depth = 4
-                        datastring += writeObject(skin_xml, current_depth)
-                        for prop in ["bones", "ix", "w"]:
-                            if skin_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, skin_xml.get(prop))
+                        yield writeObject(skin_xml, current_depth)
+                        for chunk in iterProperties(skin_xml, ["bones", "ix", "w"]):
+                            yield chunk
 
                 elif child_xml.tag == "skeleton":
                     # write bone sub objects and properties
                     for bone_xml in child_xml:
                         current_depth = 4
-                        datastring += writeObject(bone_xml, current_depth)
-                        for prop in ["ix", "pa", "tx"]:
-                            if bone_xml.get(prop) is not None:
-                                datastring += writeProperty(prop, bone_xml.get(prop))
+                        yield writeObject(bone_xml, current_depth)
+                        for chunk in iterProperties(bone_xml, ["ix", "pa", "tx"]):
+                            yield chunk
 
     # write locators root
     locator_xml = root_xml.find("locator")
     if locator_xml is not None:
         current_depth = 1
-        datastring += writeObject(locator_xml, current_depth)
+        yield writeObject(locator_xml, current_depth)
 
         # write each locator
         for locnode_xml in locator_xml:
             current_depth = 2
-            datastring += writeObject(locnode_xml, current_depth)
+            yield writeObject(locnode_xml, current_depth)
 
             # write locator properties
-            for prop in ["p", "q", "pa", "tx"]:
-                if locnode_xml.get(prop) is not None:
-                    datastring += writeProperty(prop, locnode_xml.get(prop))
+            for chunk in iterProperties(locnode_xml, ["p", "q", "pa", "tx"]):
+                yield chunk
 
-    # write the data
-    with open(filepath, "wb") as fp:
-        fp.write(datastring)
-
-
-def write_animfile(filepath, root_xml):
-    """Iterates over an XML element and writes the element structure back into a binary file as animation data."""
-    datastring = b""
 
+def iterAnimData(root_xml):
+    """Iterates over an XML element and yields the element structure as chunks of binary animation data."""
     # write the file header '@@b@'
-    header = "@@b@"
-    for x in header:
-        datastring += pack("c", x.encode())
+    yield BINARY_HEADER
 
     # write the file properties
     if root_xml.tag == "File":
-        datastring += writeProperty("pdxasset", root_xml.get("pdxasset"))
+        yield writeProperty("pdxasset", root_xml.get("pdxasset"))
     else:
         raise NotImplementedError("Unknown XML root encountered. {}".format(root_xml.tag))
 
@@ -504,37 +541,73 @@ def write_animfile(filepath, root_xml):
     info_xml = root_xml.find("info")
     if info_xml is not None:
         current_depth = 1
-        datastring += writeObject(info_xml, current_depth)
+        yield writeObject(info_xml, current_depth)
 
         # write info properties
-        for prop in ["fps", "sa", "j"]:
-            if info_xml.get(prop) is not None:
-                datastring += writeProperty(prop, info_xml.get(prop))
+        for chunk in iterProperties(info_xml, ["fps", "sa", "j"]):
+            yield chunk
 
         # write each bone
         for bone_xml in info_xml:
             current_depth = 2
-            datastring += writeObject(bone_xml, current_depth)
+            yield writeObject(bone_xml, current_depth)
 
             # write bone properties
-            for prop in ["sa", "t", "q", "s"]:
-                if bone_xml.get(prop) is not None:
-                    datastring += writeProperty(prop, bone_xml.get(prop))
+            for chunk in iterProperties(bone_xml, ["sa", "t", "q", "s"]):
+                yield chunk
 
     # write samples root
     samples_xml = root_xml.find("samples")
     if samples_xml is not None:
         current_depth = 1
-        datastring += writeObject(samples_xml, current_depth)
+        yield writeObject(samples_xml, current_depth)
 
         # write sample properties
-        for prop in ["t", "q", "s"]:
-            if samples_xml.get(prop) is not None:
-                datastring += writeProperty(prop, samples_xml.get(prop))
+        for chunk in iterProperties(samples_xml, ["t", "q", "s"]):
+            yield chunk
+
+
+def writeFile(filepath, data_chunks):
+    """Streams chunks of binary data into a file as they are generated, rather than building all the data in memory.
+    Data is written to a temporary file alongside the target, which only replaces the target once complete, so a
+    failure or interruption while generating the data leaves any existing file untouched."""
+    fd, tmp_filepath = tempfile.mkstemp(dir=path.dirname(path.abspath(filepath)))
+    replaced = False
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            for chunk in data_chunks:
+                fp.write(chunk)
+
+        # mkstemp creates files readable only by the owner, so take the mode of the file being replaced if there is
+        # one, otherwise the mode a newly created file would get
+        if path.exists(filepath):
+            shutil.copymode(filepath, tmp_filepath)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_filepath, 0o666 & ~umask)
+
+        if six.PY2:
+            # Py2 has no atomic replace, and rename will not overwrite an existing file on Windows
+            if path.exists(filepath):
+                os.remove(filepath)
+            os.rename(tmp_filepath, filepath)
+        else:
+            os.replace(tmp_filepath, filepath)
+        replaced = True
+    finally:
+        if not replaced and path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+
+
+def write_meshfile(filepath, root_xml):
+    """Iterates over an XML element and writes the element structure back into a binary file as mesh data."""
+    writeFile(filepath, iterMeshData(root_xml))
+
 
-    # write the data
-    with open(filepath, "wb") as fp:
-        fp.write(datastring)
+def write_animfile(filepath, root_xml):
+    """Iterates over an XML element and writes the element structure back into a binary file as animation data."""
+    writeFile(filepath, iterAnimData(root_xml))
 
 
 """
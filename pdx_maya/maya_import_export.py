@@ -132,22 +132,6 @@ def get_MDagPath(object_name):
     return m_DagPath
 
 
-def get_plug(mobject, plug_name):
-    mFn_DepNode = OpenMaya.MFnDependencyNode(mobject)
-    mplug = mFn_DepNode.findPlug(plug_name)
-
-    return mplug
-
-
-def connect_nodeplugs(source_mobject, source_mplug, dest_mobject, dest_mplug):
-    source_mplug = get_plug(source_mobject, source_mplug)
-    dest_mplug = get_plug(dest_mobject, dest_mplug)
-
-    m_DGMod = OpenMaya.MDGModifier()
-    m_DGMod.connect(source_mplug, dest_mplug)
-    m_DGMod.doIt()
-
-
 """ ====================================================================================================================
     Helper functions.
 ========================================================================================================================
@@ -159,6 +143,14 @@ def util_round(data, ndigits=0):
     return tuple(round(x, ndigits) for x in data)
 
 
+def split_uv_coords(uv_data):
+    """Splits a flat list of UV co-ordinates into U and V arrays, flipping the V co-ordinates into Maya space."""
+    u_array = OpenMayaAPI.MFloatArray(uv_data[0::2])
+    v_array = OpenMayaAPI.MFloatArray([1 - v for v in uv_data[1::2]])
+
+    return u_array, v_array
+
+
 def clean_imported_name(name):
     # strip any namespace names, taking the final name only
     clean_name = name.split(":")[-1]
@@ -292,7 +284,46 @@ def get_material_textures(maya_material):
     return texture_dict
 
 
-def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices=True):
+def get_mesh_data(mesh):
+    """Returns the whole-mesh data read by `get_mesh_info`, this can be gathered once and shared by each material."""
+    # API mesh function set
+    mesh_obj = get_mobject(mesh.name())
+    mFn_Mesh = OpenMayaAPI.MFnMesh(mesh_obj)
+
+    # cache some mesh data
+    vertices = mesh.getPoints(space="world")  # list of vertices positions
+    normals = mesh.getNormals(space="world")  # list of vectors for each vertex per face
+    tri_counts, tri_verts = mFn_Mesh.getTriangles()  # triangle count per face, flat list of all triangle vertices
+    tri_verts = list(tri_verts)
+    # offset of each faces first triangle into the flat list, so no per-triangle API queries are needed
+    tri_offsets = [0] * len(tri_counts)
+    offset = 0
+    for face_id, num_triangles in enumerate(tri_counts):
+        tri_offsets[face_id] = offset
+        offset += 3 * num_triangles
+    uv_setnames = [uv_set for uv_set in mesh.getUVSetNames() if mFn_Mesh.numUVs(uv_set) > 0][:PDX_MAXUVSETS]
+    uv_data = {}
+    tangents = None
+    for i, uv_set in enumerate(uv_setnames):
+        _u, _v = mesh.getUVs(uvSet=uv_set)
+        uv_data[i] = list(zip(_u, _v))
+    if uv_setnames:
+        tangents = mesh.getTangents(space="world", uvSet=uv_setnames[0])
+
+    return dict(
+        mFn_Mesh=mFn_Mesh,
+        vertices=vertices,
+        normals=normals,
+        tri_counts=tri_counts,
+        tri_verts=tri_verts,
+        tri_offsets=tri_offsets,
+        uv_setnames=uv_setnames,
+        uv_data=uv_data,
+        tangents=tangents,
+    )
+
+
+def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices=True, mesh_data=None):
     """Returns a dictionary of mesh information neccessary to the exporter.
 
     This performs a tri-split on all points to create unique vertices where points have split UV or Normal data.
@@ -300,6 +331,7 @@ def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices
 
     Points are processed in order of vertex id for each triangle to maintain compatibility with the official exporter.
     `sort_vertices` will allow for descending/DCC-native/ascending vertex order.
+    `mesh_data` can be given from `get_mesh_data` to avoid gathering the whole mesh data again.
     """
     # get references to MeshFace and Mesh types
     if isinstance(maya_mesh, pmc.general.MeshFace):
@@ -311,22 +343,18 @@ def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices
     else:
         raise RuntimeError("Unsupported mesh type encountered. {0}".format(type(maya_mesh)))
 
-    # API mesh function set
-    mesh_obj = get_mobject(mesh.name())
-    mFn_Mesh = OpenMayaAPI.MFnMesh(mesh_obj)
-
-    # cache some mesh data
-    vertices = mesh.getPoints(space="world")  # list of vertices positions
-    normals = mesh.getNormals(space="world")  # list of vectors for each vertex per face
-    triangles = mesh.getTriangles()
-    uv_setnames = [uv_set for uv_set in mesh.getUVSetNames() if mFn_Mesh.numUVs(uv_set) > 0][:PDX_MAXUVSETS]
-    uv_data = {}
-    tangents = None
-    for i, uv_set in enumerate(uv_setnames):
-        _u, _v = mesh.getUVs(uvSet=uv_set)
-        uv_data[i] = list(zip(_u, _v))
-    if uv_setnames:
-        tangents = mesh.getTangents(space="world", uvSet=uv_setnames[0])
+    # whole-mesh data, which can be passed in when exporting several materials from the same mesh
+    if mesh_data is None:
+        mesh_data = get_mesh_data(mesh)
+    mFn_Mesh = mesh_data["mFn_Mesh"]
+    vertices = mesh_data["vertices"]
+    normals = mesh_data["normals"]
+    tri_counts = mesh_data["tri_counts"]
+    tri_verts = mesh_data["tri_verts"]
+    tri_offsets = mesh_data["tri_offsets"]
+    uv_setnames = mesh_data["uv_setnames"]
+    uv_data = mesh_data["uv_data"]
+    tangents = mesh_data["tangents"]
 
     # build a blank dictionary of mesh information for the exporter
     mesh_dict = {x: [] for x in ["p", "n", "ta", "u0", "u1", "u2", "u3", "tri", "min", "max"]}
@@ -336,18 +364,22 @@ def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices
     split_criteria = split_criteria or ["id", "p", "n", "uv"]
     UniqueVertex = namedtuple("UniqueVertex", split_criteria)
 
-    # collect all unique verts in the order that we process them
+    # collect all unique verts in the order that we process them, and map each to its index in that order
     export_verts = []
-    unique_verts = set()
+    unique_verts = {}
 
     for face in meshfaces:
         face_id = face.index()
-        face_vert_ids = face.getVertices()  # vertices making this face
-        num_triangles = triangles[0][face_id]  # number of triangles making this face
+        # vertices making this face, mapped to their face relative index (the first index, should a vertex repeat)
+        face_vert_ids = {}
+        for local_id, vert_id in enumerate(face.getVertices()):
+            face_vert_ids.setdefault(vert_id, local_id)
+        num_triangles = tri_counts[face_id]  # number of triangles making this face
 
         # store data for each tri of each face
         for tri in range(0, num_triangles):
-            tri_vert_ids = mesh.getPolygonTriangleVertices(face_id, tri)  # vertices making this triangle
+            tri_start = tri_offsets[face_id] + 3 * tri
+            tri_vert_ids = tri_verts[tri_start : tri_start + 3]  # vertices making this triangle
 
             # process verts for each triangle, sort the list of tri-verts in vertex order or use default Maya ordering
             if sort_vertices is not None:
@@ -360,7 +392,7 @@ def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices
             dict_vert_idx = []
             # iterate over tri verts
             for vert_id in tri_vert_ids:
-                _local_id = face_vert_ids.index(vert_id)  # face relative vertex index
+                _local_id = face_vert_ids[vert_id]  # face relative vertex index
 
                 # position
                 _position = vertices[vert_id]
@@ -397,13 +429,12 @@ def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices
                 # test if we have already stored this vertex in the unique set
                 i = None
                 if not split_all:
-                    if new_vert in unique_verts:
-                        # no new data to be added to the mesh dict, the tri will reference an existing vert
-                        i = export_verts.index(new_vert)
+                    # no new data to be added to the mesh dict if the tri can reference an existing vert
+                    i = unique_verts.get(new_vert)
 
                 if i is None:
                     # collect the new vertex
-                    unique_verts.add(new_vert)
+                    unique_verts.setdefault(new_vert, len(export_verts))
                     export_verts.append(new_vert)
 
                     # add this vert data to the mesh dict
@@ -430,10 +461,10 @@ def get_mesh_info(maya_mesh, split_criteria=None, split_all=False, sort_vertices
         # no mesh data collected?
         return {}, []
 
-    # calculate mesh bounds
-    x_vtx_pos = set(mesh_dict["p"][::3])
-    y_vtx_pos = set(mesh_dict["p"][1::3])
-    z_vtx_pos = set(mesh_dict["p"][2::3])
+    # calculate mesh bounds, from each axis of the flat position list
+    x_vtx_pos = mesh_dict["p"][::3]
+    y_vtx_pos = mesh_dict["p"][1::3]
+    z_vtx_pos = mesh_dict["p"][2::3]
     # min and max axis aligned bounding box
     mesh_dict["min"] = [min(x_vtx_pos), min(y_vtx_pos), min(z_vtx_pos)]
     mesh_dict["max"] = [max(x_vtx_pos), max(y_vtx_pos), max(z_vtx_pos)]
@@ -571,16 +602,16 @@ def get_locators_info(maya_locators):
     locator_list = [{"name": x.name()} for x in maya_locators]
 
     for i, loc in enumerate(maya_locators):
-        # unparented, use worldspace position/rotation
-        _position = loc.getTranslation(worldSpace=True)
-        _rotation = loc.getRotation(worldSpace=True, quaternion=True)
-
         # parented to bone, use local position/rotation
         loc_parent = loc.getParent()
         if loc_parent is not None and isinstance(loc_parent, pmc.nt.Joint):
             locator_list[i]["pa"] = [loc_parent.name()]
             _position = loc.getTranslation()
             _rotation = loc.getRotation(quaternion=True)
+        # unparented, use worldspace position/rotation
+        else:
+            _position = loc.getTranslation(worldSpace=True)
+            _rotation = loc.getRotation(worldSpace=True, quaternion=True)
 
         locator_list[i]["p"] = list(swap_coord_space(_position))
         locator_list[i]["q"] = list(swap_coord_space(_rotation))
@@ -777,7 +808,6 @@ def create_locator(PDX_locator, PDX_bone_dict):
     """Creates a Maya Locator object."""
     # create locator
     new_loc = pmc.spaceLocator()
-    pmc.select(new_loc)
     pmc.rename(new_loc, PDX_locator.name)
 
     # check for parent, then parent locator to scene bone, or apply parents transform
@@ -849,6 +879,11 @@ def create_skeleton(PDX_bone_list):
     # keep track of bones as we create them
     bone_list = [None for _ in range(0, len(PDX_bone_list))]
 
+    # index joints in the scene by name once, rather than listing the scene again for every bone
+    scene_joints = defaultdict(list)
+    for joint_path in cmds.ls(type="joint", long=True) or []:
+        scene_joints[joint_path.split("|")[-1]].append(joint_path)
+
     pmc.select(clear=True)
     for bone in PDX_bone_list:
         index = bone.ix[0]
@@ -860,28 +895,30 @@ def create_skeleton(PDX_bone_list):
         unique_name = clean_imported_name(bone.name)
 
         # check if bone already exists, possible the skeleton is already built so collect and return joints
-        existing_bone = pmc.ls(unique_name, type="joint")
+        existing_bone = scene_joints.get(unique_name, [])
         if len(existing_bone) == 1:
             bone_list[index] = pmc.PyNode(existing_bone[0])
             continue
 
         # create joint
         new_bone = pmc.joint()
-        pmc.select(new_bone)
         pmc.rename(new_bone, unique_name)
         pmc.parent(new_bone, world=True)
         bone_list[index] = new_bone
+        scene_joints[new_bone.nodeName()].append(new_bone)
 
-        # set transform
+        # set transform, the joint is still parented to the world so its local transform is its world-space transform
         # fmt: off
-        mat = pmdt.Matrix(
-            transform[0], transform[1], transform[2], 0.0,
-            transform[3], transform[4], transform[5], 0.0,
-            transform[6], transform[7], transform[8], 0.0,
-            transform[9], transform[10], transform[11], 1.0,
-        )
+        mat = MMatrix((
+            (transform[0], transform[1], transform[2], 0.0),
+            (transform[3], transform[4], transform[5], 0.0),
+            (transform[6], transform[7], transform[8], 0.0),
+            (transform[9], transform[10], transform[11], 1.0),
+        ))
         # fmt: on
-        new_bone.setMatrix(swap_coord_space(mat.inverse()), worldSpace=True)  # set to matrix inverse in world-space
+        bone_Xform = MTransformationMatrix(swap_coord_space(mat.inverse()))  # set to matrix inverse
+        mFn_Xform = OpenMayaAPI.MFnTransform(get_mobject(new_bone.longName()))
+        mFn_Xform.setTransformation(bone_Xform)
         pmc.select(clear=True)
 
         # connect to parent
@@ -902,17 +939,10 @@ def create_skin(PDX_skin, mesh, skeleton, max_infs=None):
     if max_infs is None:
         max_infs = PDX_MAXSKININFS
 
-    # create dictionary of skinning info per vertex
-    skin_dict = dict()
-
+    # skin data is stored as a fixed number of joint indices and weights per vertex
     num_infs = PDX_skin.bones[0]
-    for vtx in range(0, int(len(PDX_skin.ix) / max_infs)):
-        skin_dict[vtx] = dict(joints=[], weights=[])
-
-    # gather joint index and weighting that each vertex is skinned to
-    for vtx, j in enumerate(range(0, len(PDX_skin.ix), max_infs)):
-        skin_dict[vtx]["joints"] = PDX_skin.ix[j : j + num_infs]
-        skin_dict[vtx]["weights"] = PDX_skin.w[j : j + num_infs]
+    num_verts = int(len(PDX_skin.ix) / max_infs)
+    num_joints = len(skeleton)
 
     # select mesh and joints
     pmc.select(skeleton, mesh)
@@ -929,26 +959,26 @@ def create_skin(PDX_skin, mesh, skeleton, max_infs=None):
 
     mesh_dag = get_MDagPath(mesh.name())
 
-    indices = OpenMaya.MIntArray()
-    for vtx in range(len(skin_dict.keys())):
-        indices.append(vtx)
     mFn_SingleIdxCo = OpenMaya.MFnSingleIndexedComponent()
     vertex_IdxCo = mFn_SingleIdxCo.create(OpenMaya.MFn.kMeshVertComponent)
-    mFn_SingleIdxCo.addElements(indices)  # must only add indices after running create()
+    mFn_SingleIdxCo.setCompleteData(num_verts)  # component of all vertices, must only be set after running create()
 
     infs = OpenMaya.MIntArray()
-    for j in range(len(skeleton)):
+    for j in range(num_joints):
         infs.append(j)
 
-    weights = OpenMaya.MDoubleArray()
-    for vtx in range(len(skin_dict.keys())):
-        jts = skin_dict[vtx]["joints"]
-        wts = skin_dict[vtx]["weights"]
-        for j in range(len(skeleton)):
-            if j in jts:
-                weights.append(wts[jts.index(j)])
-            else:
-                weights.append(0.0)
+    # weights for every joint per vertex, preallocated as zero so only the joints each vertex uses need setting
+    weights = OpenMaya.MDoubleArray(num_verts * num_joints, 0.0)
+    for vtx in range(num_verts):
+        i = vtx * max_infs
+        jts = PDX_skin.ix[i : i + num_infs]
+        wts = PDX_skin.w[i : i + num_infs]
+        set_jts = set()
+        for jnt, wgt in zip(jts, wts):
+            # unused influences have a negative joint index, a repeated joint keeps its first weight
+            if 0 <= jnt < num_joints and jnt not in set_jts:
+                set_jts.add(jnt)
+                weights.set(wgt, vtx * num_joints + jnt)
 
     # set skin weights
     mFn_SkinCluster.setWeights(mesh_dag, vertex_IdxCo, infs, weights)
@@ -980,50 +1010,40 @@ def create_mesh(PDX_mesh, name=None):
             uv_Ch[i] = getattr(PDX_mesh, uv)  # flat list of 2d co-ordinates, u0[:1] = vtx[0]uv0
 
     # build the following arguments for the MFnMesh.create() function
-    # numVertices, numPolygons, vertexArray, polygonCounts, polygonConnects, uArray, vArray, new_transform
+    # vertexArray, polygonCounts, polygonConnects, uArray, vArray, new_transform
+    # API 2.0 arrays are constructed from whole Python sequences, rather than appending elements one at a time
 
     # vertices
-    numVertices = 0
-    vertexArray = OpenMaya.MFloatPointArray()  # array of points
-    for i in range(0, len(verts), 3):
-        _verts = swap_coord_space([verts[i], verts[i + 1], verts[i + 2]])
-        v = OpenMaya.MFloatPoint(_verts[0], _verts[1], _verts[2])
-        vertexArray.append(v)
-        numVertices += 1
+    vertexArray = OpenMayaAPI.MPointArray(  # array of points
+        [OpenMayaAPI.MPoint(swap_coord_space(verts[i : i + 3])) for i in range(0, len(verts), 3)]
+    )
+    numVertices = len(vertexArray)
 
     # faces
     numPolygons = int(len(tris) / 3)
-    polygonCounts = OpenMaya.MIntArray()  # count of vertices per poly
-    for _ in range(0, numPolygons):
-        polygonCounts.append(3)
+    polygonCounts = OpenMayaAPI.MIntArray([3] * numPolygons)  # count of vertices per poly
 
     # vert connections
-    polygonConnects = OpenMaya.MIntArray()
-    for i in range(0, len(tris), 3):
-        polygonConnects.append(tris[i + 2])  # convert handedness to Maya space
-        polygonConnects.append(tris[i + 1])
-        polygonConnects.append(tris[i])
+    polygonConnects = OpenMayaAPI.MIntArray(
+        # convert handedness to Maya space
+        [vtx for i in range(0, len(tris), 3) for vtx in (tris[i + 2], tris[i + 1], tris[i])]
+    )
 
     # default UVs
-    uArray = OpenMaya.MFloatArray()
-    vArray = OpenMaya.MFloatArray()
+    uArray = OpenMayaAPI.MFloatArray()
+    vArray = OpenMayaAPI.MFloatArray()
     if uv_Ch.get(0):
-        uv_data = uv_Ch[0]
-        for i in range(0, len(uv_data), 2):
-            uArray.append(uv_data[i])
-            vArray.append(1 - uv_data[i + 1])  # flip the UV coords in V!
+        uArray, vArray = split_uv_coords(uv_Ch[0])
 
     """ ================================================================================================================
         Create the new mesh """
 
     # create the data structures for mesh and transform
-    mFn_Mesh = OpenMaya.MFnMesh()
-    m_DagMod = OpenMaya.MDagModifier()
+    mFn_Mesh = OpenMayaAPI.MFnMesh()
+    m_DagMod = OpenMayaAPI.MDagModifier()
     new_transform = m_DagMod.createNode("transform")
 
-    mFn_Mesh.create(
-        numVertices, numPolygons, vertexArray, polygonCounts, polygonConnects, uArray, vArray, new_transform
-    )
+    mFn_Mesh.create(vertexArray, polygonCounts, polygonConnects, uArray, vArray, new_transform)
 
     # set up the transform parent to the new mesh (linking it to the scene)
     m_DagMod.doIt()
@@ -1038,30 +1058,21 @@ def create_mesh(PDX_mesh, name=None):
         # set shape name
         pmc.rename(new_mesh, mesh_name)
         # set transform name
-        mFn_Transform = OpenMaya.MFnTransform(new_transform)
+        mFn_Transform = OpenMayaAPI.MFnTransform(new_transform)
         mFn_Transform.setName(mesh_name.replace("Shape", ""))
 
     # apply the vertex normal data
     if norms:
-        normalsIn = OpenMaya.MVectorArray()  # array of vectors
-        for i in range(0, len(norms), 3):
-            _norms = swap_coord_space([norms[i], norms[i + 1], norms[i + 2]])  # convert vector to Maya space
-            n = OpenMaya.MVector(_norms[0], _norms[1], _norms[2])
-            normalsIn.append(n)
-        vertexList = OpenMaya.MIntArray()  # matches normal to vert by index
-        for i in range(0, numVertices):
-            vertexList.append(i)
+        normalsIn = OpenMayaAPI.MVectorArray(  # array of vectors, converted to Maya space
+            [swap_coord_space(norms[i : i + 3]) for i in range(0, len(norms), 3)]
+        )
+        vertexList = OpenMayaAPI.MIntArray(list(range(numVertices)))  # matches normal to vert by index
         mFn_Mesh.setVertexNormals(normalsIn, vertexList)
 
     # apply the UV data channels
-    uvCounts = OpenMaya.MIntArray()
-    for _ in range(0, numPolygons):
-        uvCounts.append(3)
-    uvIds = OpenMaya.MIntArray()
-    for i in range(0, len(tris), 3):
-        uvIds.append(tris[i + 2])  # convert handedness to Maya space
-        uvIds.append(tris[i + 1])
-        uvIds.append(tris[i])
+    # UVs are stored per vertex, so each face has the same UV counts and ids as its vertex counts and connections
+    uvCounts = polygonCounts
+    uvIds = polygonConnects
 
     # note we don't call setUVs before assignUVs for the default UV set, this was done during creation!
     if uv_Ch.get(0):
@@ -1071,16 +1082,10 @@ def create_mesh(PDX_mesh, name=None):
     for idx in uv_Ch:
         # ignore Ch 0 as we have already set this
         if idx != 0:
-            uv_data = uv_Ch[idx]
             uvSetName = "map" + str(idx + 1)
+            uArray, vArray = split_uv_coords(uv_Ch[idx])
 
-            uArray = OpenMaya.MFloatArray()
-            vArray = OpenMaya.MFloatArray()
-            for i in range(0, len(uv_data), 2):
-                uArray.append(uv_data[i])
-                vArray.append(1 - uv_data[i + 1])  # flip the UV coords in V!
-
-            mFn_Mesh.createUVSetWithName(uvSetName)
+            mFn_Mesh.createUVSet(uvSetName)
             mFn_Mesh.setUVs(uArray, vArray, uvSetName)
             mFn_Mesh.assignUVs(uvCounts, uvIds, uvSetName)
 
@@ -1090,7 +1095,7 @@ def create_mesh(PDX_mesh, name=None):
     pmc.select(new_mesh)
     shd_group = pmc.PyNode("initialShadingGroup")
     pmc.hyperShade(assign=shd_group)
-    new_obj = pmc.PyNode(new_transform)
+    new_obj = new_mesh.getParent()
 
     return new_mesh, new_obj
 
@@ -1099,12 +1104,13 @@ def create_animcurve(joint, attr):
     mFn_AnimCurve = OpenMayaAnim.MFnAnimCurve()
 
     # use the attribute on the joint to determine which type of anim curve to create
-    in_plug = get_plug(joint, attr)
+    mFn_DepNode = OpenMaya.MFnDependencyNode(joint)
+    in_plug = mFn_DepNode.findPlug(attr)
     plug_type = mFn_AnimCurve.timedAnimCurveTypeForPlug(in_plug)
 
     # create the curve and get its output attribute
     anim_curve = mFn_AnimCurve.create(plug_type)
-    mFn_AnimCurve.setName("{0}_{1}".format(OpenMaya.MFnDependencyNode(joint).name(), attr))
+    mFn_AnimCurve.setName("{0}_{1}".format(mFn_DepNode.name(), attr))
 
     # check for and remove any existing animation curve
     if in_plug.isConnected():
@@ -1122,8 +1128,10 @@ def create_animcurve(joint, attr):
     #         if mObj.hasFn(OpenMaya.MFn.kAnimCurve):
     #             return None, OpenMayaAnim.MFnAnimCurve(mObj)
 
-    # connect the new animation curve to the attribute on the joint
-    connect_nodeplugs(anim_curve, "output", joint, attr)
+    # connect the new animation curve to the attribute on the joint, reusing the plugs we already have
+    m_DGMod = OpenMaya.MDGModifier()
+    m_DGMod.connect(mFn_AnimCurve.findPlug("output"), in_plug)
+    m_DGMod.doIt()
 
     return anim_curve, mFn_AnimCurve
 
@@ -1158,10 +1166,9 @@ def create_anim_keys(joint_name, key_dict, timestart):
 
         for scale_data in key_dict["s"]:
             # TODO: if maya_up == "z"
-            s = MVector(*scale_data)
-            x_scale_data.append(s[0])
-            y_scale_data.append(s[1])
-            z_scale_data.append(s[2])
+            x_scale_data.append(scale_data[0])
+            y_scale_data.append(scale_data[1])
+            z_scale_data.append(scale_data[2])
 
         # add keys to the new curves
         for attrib, data_array in zip(animated_attrs, [x_scale_data, y_scale_data, z_scale_data]):
@@ -1208,7 +1215,7 @@ def create_anim_keys(joint_name, key_dict, timestart):
         z_trans_data = OpenMaya.MDoubleArray()
 
         for trans_data in key_dict["t"]:
-            t = swap_coord_space(MVector(*trans_data))
+            t = swap_coord_space(trans_data)
             x_trans_data.append(t[0])
             y_trans_data.append(t[1])
             z_trans_data.append(t[2])
@@ -1235,6 +1242,8 @@ def import_meshfile(meshpath, imp_mesh=True, imp_skel=True, imp_locs=True, join_
 
     # read the file into an XML structure
     asset_elem = pdx_data.read_meshfile(meshpath)
+    # textures are looked up relative to the mesh file
+    mesh_dir = os.path.split(meshpath)[0]
 
     # find shapes and locators
     shapes = asset_elem.find("object")
@@ -1243,75 +1252,81 @@ def import_meshfile(meshpath, imp_mesh=True, imp_skel=True, imp_locs=True, join_
     # store all bone transforms, irrespective of skin association
     complete_bone_dict = dict()
 
-    # go through shapes
-    for i, node in enumerate(shapes):
-        IO_PDX_LOG.info("creating node {0}/{1} - {2}".format(i + 1, len(shapes), node.tag))
-        progress("update", 1, "creating node")
-
-        # create the skeleton first, so we can skin the mesh to it
-        joints = None
-        skeleton = node.find("skeleton")
-        if skeleton:
-            pdx_bone_list = list()
-            for b in skeleton:
-                pdx_bone = pdx_data.PDXData(b)
-                pdx_bone_list.append(pdx_bone)
-                complete_bone_dict[pdx_bone.name] = pdx_bone.tx
-
-            if imp_skel:
-                IO_PDX_LOG.info("creating skeleton - {0} bones".format(len(pdx_bone_list)))
-                progress("update", 1, "creating skeleton")
-                joints = create_skeleton(pdx_bone_list)
-
-        # then create all the meshes
-        meshes = node.findall("mesh")
-        if imp_mesh and meshes:
-            created = []
-            for mat_idx, m in enumerate(meshes):
-                IO_PDX_LOG.info("creating mesh - {0}".format(mat_idx))
-                progress("update", 1, "creating mesh")
-                pdx_mesh = pdx_data.PDXData(m)
-                pdx_material = getattr(pdx_mesh, "material", None)
-                pdx_skin = getattr(pdx_mesh, "skin", None)
-
-                # create the geometry
-                if join_materials:
-                    meshmaterial_name = node.tag if mat_idx == 0 else "{0}-{1:0>3}".format(node.tag, mat_idx)
-                else:
-                    meshmaterial_name = "{0}-{1:0>3}".format(node.tag, mat_idx)
-                mesh, obj = create_mesh(pdx_mesh, name=meshmaterial_name)
-                created.append(obj)
-
-                # set mesh index from source file
-                set_mesh_index(mesh, i)
-
-                # create the material
-                if pdx_material:
-                    IO_PDX_LOG.info("creating material - {0}".format(pdx_material.shader[0]))
-                    progress("update", 1, "creating material")
-                    create_material(pdx_material, mesh, os.path.split(meshpath)[0])
-
-                # create the skin cluster
-                if joints and pdx_skin:
-                    IO_PDX_LOG.info("creating skinning data -")
-                    progress("update", 1, "creating skinning data")
-                    create_skin(pdx_skin, mesh, joints)
-
-            if join_materials and len(created) > 1:
-                name = created[0].name()
-                try:
-                    joined_mesh = pmc.polyUniteSkinned(*created, constructionHistory=False, mergeUVSets=1)[0]
-                except RuntimeError:  # Maya raises this when using polyUniteSkinned on a group of unskinned meshes
-                    joined_mesh = pmc.polyUnite(*created, constructionHistory=False, mergeUVSets=1)[0]
-                pmc.rename(joined_mesh, name)
-
-    # go through locators
-    if imp_locs and locators:
-        progress("update", 1, "creating locators")
-        for i, loc in enumerate(locators):
-            IO_PDX_LOG.info("creating locator {0}/{1} - {2}".format(i + 1, len(locators), loc.tag))
-            pdx_locator = pdx_data.PDXData(loc)
-            obj = create_locator(pdx_locator, complete_bone_dict)
+    # suspend viewport refreshes while the scene is built, scene changes otherwise redraw as each node is created
+    try:
+        cmds.refresh(suspend=True)
+        # go through shapes
+        for i, node in enumerate(shapes):
+            IO_PDX_LOG.info("creating node {0}/{1} - {2}".format(i + 1, len(shapes), node.tag))
+            progress("update", 1, "creating node")
+
+            # create the skeleton first, so we can skin the mesh to it
+            joints = None
+            skeleton = node.find("skeleton")
+            if skeleton:
+                pdx_bone_list = list()
+                for b in skeleton:
+                    pdx_bone = pdx_data.PDXData(b)
+                    pdx_bone_list.append(pdx_bone)
+                    complete_bone_dict[pdx_bone.name] = pdx_bone.tx
+
+                if imp_skel:
+                    IO_PDX_LOG.info("creating skeleton - {0} bones".format(len(pdx_bone_list)))
+                    progress("update", 1, "creating skeleton")
+                    joints = create_skeleton(pdx_bone_list)
+
+            # then create all the meshes
+            meshes = node.findall("mesh")
+            if imp_mesh and meshes:
+                created = []
+                for mat_idx, m in enumerate(meshes):
+                    IO_PDX_LOG.info("creating mesh - {0}".format(mat_idx))
+                    progress("update", 1, "creating mesh")
+                    pdx_mesh = pdx_data.PDXData(m)
+                    pdx_material = getattr(pdx_mesh, "material", None)
+                    pdx_skin = getattr(pdx_mesh, "skin", None)
+
+                    # create the geometry
+                    if join_materials:
+                        meshmaterial_name = node.tag if mat_idx == 0 else "{0}-{1:0>3}".format(node.tag, mat_idx)
+                    else:
+                        meshmaterial_name = "{0}-{1:0>3}".format(node.tag, mat_idx)
+                    mesh, obj = create_mesh(pdx_mesh, name=meshmaterial_name)
+                    created.append(obj)
+
+                    # set mesh index from source file
+                    set_mesh_index(mesh, i)
+
+                    # create the material
+                    if pdx_material:
+                        IO_PDX_LOG.info("creating material - {0}".format(pdx_material.shader[0]))
+                        progress("update", 1, "creating material")
+                        create_material(pdx_material, mesh, mesh_dir)
+
+                    # create the skin cluster
+                    if joints and pdx_skin:
+                        IO_PDX_LOG.info("creating skinning data -")
+                        progress("update", 1, "creating skinning data")
+                        create_skin(pdx_skin, mesh, joints)
+
+                if join_materials and len(created) > 1:
+                    name = created[0].name()
+                    try:
+                        joined_mesh = pmc.polyUniteSkinned(*created, constructionHistory=False, mergeUVSets=1)[0]
+                    except RuntimeError:  # Maya raises this when using polyUniteSkinned on a group of unskinned meshes
+                        joined_mesh = pmc.polyUnite(*created, constructionHistory=False, mergeUVSets=1)[0]
+                    pmc.rename(joined_mesh, name)
+
+        # go through locators
+        if imp_locs and locators:
+            progress("update", 1, "creating locators")
+            for i, loc in enumerate(locators):
+                IO_PDX_LOG.info("creating locator {0}/{1} - {2}".format(i + 1, len(locators), loc.tag))
+                pdx_locator = pdx_data.PDXData(loc)
+                obj = create_locator(pdx_locator, complete_bone_dict)
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.refresh(force=True)
 
     pmc.select(None)
     IO_PDX_LOG.info("import finished! ({0:.4f} sec)".format(time.time() - start))
@@ -1378,6 +1393,8 @@ def export_meshfile(meshpath, exp_mesh=True, exp_skel=True, exp_locs=True, exp_s
 
             # one shape can have multiple materials on a per meshface basis
             shading_groups = list(set(shape.connections(type="shadingEngine")))
+            # whole-mesh data is gathered once, then shared by each material
+            mesh_data = None
 
             for mat_idx, group in enumerate(shading_groups):
                 # this type of ObjectSet associates shaders with geometry
@@ -1397,8 +1414,10 @@ def export_meshfile(meshpath, exp_mesh=True, exp_skel=True, exp_locs=True, exp_s
                 mesh = [meshface for meshface in group.members(flatten=True) if meshface.node() == shape][0]
 
                 # get all necessary info about this set of faces and determine which unique verts they include
+                if mesh_data is None:
+                    mesh_data = get_mesh_data(shape)
                 mesh_info_dict, vert_ids = get_mesh_info(
-                    mesh, split_criteria=split_by, split_all=split_verts, sort_vertices=sort_verts
+                    mesh, split_criteria=split_by, split_all=split_verts, sort_vertices=sort_verts, mesh_data=mesh_data
                 )
                 # skip shading groups that are used on no faces
                 if not (mesh_info_dict and vert_ids):
@@ -1485,7 +1504,11 @@ def export_meshfile(meshpath, exp_mesh=True, exp_skel=True, exp_locs=True, exp_s
 
     # populate locator data
     if exp_locs:
-        maya_locators = [t for t in pmc.ls(type="transform") if pmc.listRelatives(t, shapes=True, type="locator")]
+        # find the transforms of all locator shapes, rather than querying the shapes of every transform in the scene
+        # (all parents, so that each instance of an instanced locator shape is found)
+        locator_shapes = cmds.ls(type="locator", long=True)
+        locator_xforms = cmds.listRelatives(locator_shapes, allParents=True, fullPath=True) if locator_shapes else []
+        maya_locators = [pmc.PyNode(t) for t in OrderedDict.fromkeys(locator_xforms or [])]
         # optionally intersect with selection
         if exp_selected:
             maya_locators = [obj for obj in maya_locators if obj in current_selection]
@@ -1550,12 +1573,13 @@ def import_animfile(animpath, frame_start=1, **kwargs):
     progress("update", 1, "finding bones")
     scale_length = set()
     bone_errors = []
+    bone_joints = dict()  # scene joint for each bone, looked up once and reused below
     for bone in info:
         scale_length.add(len(bone.attrib["s"]))
         bone_name = clean_imported_name(bone.tag)
         try:
             matching_bones = pmc.ls(bone_name, type=pmc.nt.Joint, long=True)  # type: pmc.nodetypes.joint
-            bone_joint = matching_bones[0]
+            bone_joints[bone_name] = matching_bones[0]
         except IndexError:
             bone_errors.append(bone_name)
             IO_PDX_LOG.warning("failed to find bone - {0}".format(bone_name))
@@ -1581,8 +1605,7 @@ def import_animfile(animpath, frame_start=1, **kwargs):
     IO_PDX_LOG.info("setting initial pose on bones - {0}".format(len(info)))
     for bone in info:
         bone_name = clean_imported_name(bone.tag)
-        matching_bones = pmc.ls(bone_name, type=pmc.nt.Joint, long=True)  # type: pmc.nodetypes.joint
-        bone_joint = matching_bones[0]
+        bone_joint = bone_joints[bone_name]
 
         # set initial transform and remove any joint orientation (this is baked into rotation values in the .anim file)
         if bone_joint:
@@ -1610,24 +1633,18 @@ def import_animfile(animpath, frame_start=1, **kwargs):
         bone_name = clean_imported_name(bone.tag)
         all_bone_keyframes[bone_name] = OrderedDict((sample_type, []) for sample_type in bone.attrib["sa"][0])
 
-    # then traverse the samples data to store keys per bone
-    s_idx, q_idx, t_idx = 0, 0, 0  # track offsets into samples data arrays
-    s_len, q_len, t_len = scale_length, 4, 3  # track stride across samples data arrays
-    for _ in range(0, framecount):
-        for bone_name in all_bone_keyframes:
-            bone_key_data = all_bone_keyframes[bone_name]
-            if "s" in bone_key_data:
-                frame_bone_scale = samples.attrib["s"][s_idx : s_idx + s_len] * scale_padding
-                bone_key_data["s"].append(frame_bone_scale)
-                s_idx += s_len
-            if "q" in bone_key_data:
-                frame_bone_quat = samples.attrib["q"][q_idx : q_idx + q_len]
-                bone_key_data["q"].append(frame_bone_quat)
-                q_idx += q_len
-            if "t" in bone_key_data:
-                frame_bone_trans = samples.attrib["t"][t_idx : t_idx + t_len]
-                bone_key_data["t"].append(frame_bone_trans)
-                t_idx += t_len
+    # then slice the samples data to store keys per bone
+    # each samples data array stores frames in sequence, a frame holds a sample for each bone animating that type
+    for sample_type, sample_len, padding in [("s", scale_length, scale_padding), ("q", 4, 1), ("t", 3, 1)]:
+        sampled_bones = [key_data for key_data in all_bone_keyframes.values() if sample_type in key_data]
+        if not sampled_bones:
+            continue
+        sample_data = samples.attrib[sample_type]
+        frame_stride = sample_len * len(sampled_bones)  # track stride across samples data arrays
+        for bone_idx, bone_key_data in enumerate(sampled_bones):
+            # offsets of this bones sample into each frame
+            offsets = range(bone_idx * sample_len, frame_stride * framecount, frame_stride)
+            bone_key_data[sample_type] = [sample_data[i : i + sample_len] * padding for i in offsets]
 
     for bone_name in all_bone_keyframes:
         bone_keys = all_bone_keyframes[bone_name]
@@ -1638,7 +1655,7 @@ def import_animfile(animpath, frame_start=1, **kwargs):
             if any(non_uni_keys):
                 IO_PDX_LOG.debug("Bone: {0} has non-uniform scale keyframes at: {1}".format(bone_name, non_uni_keys))
             progress("update", 1, "setting keyframes on bone")
-            bone_long_name = pmc.ls(bone_name, type=pmc.nt.Joint, long=True)[0].name()
+            bone_long_name = bone_joints[bone_name].name()
             create_anim_keys(bone_long_name, bone_keys, frame_start)
 
     pmc.select(None)